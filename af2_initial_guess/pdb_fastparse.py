@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled PDB reader
+Scans ATOM/HETATM records of the first model using fixed PDB columns and
+fills preallocated NumPy arrays, without creating per-atom Python objects
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Dict
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Leave functions uncompiled when numba is not installed"""
+        return lambda func: func
+
+# ASCII codes used while scanning
+_NEWLINE, _CR, _SPACE, _MINUS, _DOT = 10, 13, 32, 45, 46
+
+@njit(cache=True)
+def _column(buf, line_start, line_end, i):
+    """Byte at column offset i of the line, blank past the end of the line"""
+    pos = line_start + i
+    return buf[pos] if pos < line_end else _SPACE
+
+@njit(cache=True)
+def _pack(buf, line_start, line_end, start, stop):
+    """Pack up to 4 column bytes into one integer code"""
+    code = 0
+    for i in range(start, stop):
+        code = (code << 8) | _column(buf, line_start, line_end, i)
+    return code
+
+@njit(cache=True)
+def _parse_int(buf, line_start, line_end, start, stop):
+    """Parse a right-justified integer column"""
+    value = 0
+    sign = 1
+    for i in range(start, stop):
+        c = _column(buf, line_start, line_end, i)
+        if c == _MINUS:
+            sign = -1
+        elif 48 <= c <= 57:
+            value = value * 10 + (c - 48)
+    return sign * value
+
+@njit(cache=True)
+def _parse_float(buf, line_start, line_end, start, stop):
+    """Parse a fixed-point decimal column"""
+    mantissa = 0
+    decimals = -1
+    sign = 1.0
+    for i in range(start, stop):
+        c = _column(buf, line_start, line_end, i)
+        if c == _MINUS:
+            sign = -1.0
+        elif c == _DOT:
+            decimals = 0
+        elif 48 <= c <= 57:
+            mantissa = mantissa * 10 + (c - 48)
+            if decimals >= 0:
+                decimals += 1
+    if decimals <= 0:
+        return sign * mantissa
+    return sign * mantissa / 10.0 ** decimals
+
+@njit(cache=True)
+def _starts_with(buf, line_start, line_end, prefix):
+    """Whether the line starts with the given record name"""
+    if line_end - line_start < len(prefix):
+        return False
+    for i in range(len(prefix)):
+        if buf[line_start + i] != prefix[i]:
+            return False
+    return True
+
+@njit(cache=True)
+def parse_atoms(buf, coord, res_id, occupancy, b_factor, hetero,
+                chain_code, ins_code, res_name_code, atom_name_code, element_code):
+    """
+    Fill the output arrays from the ATOM/HETATM records of the first model
+    Alternate locations other than the first one of each residue are skipped
+    Returns the number of atoms written
+    """
+    atom_record = np.array([65, 84, 79, 77], dtype=np.uint8)  # ATOM
+    hetatm_record = np.array([72, 69, 84, 65, 84, 77], dtype=np.uint8)  # HETATM
+    endmdl_record = np.array([69, 78, 68, 77, 68, 76], dtype=np.uint8)  # ENDMDL
+
+    num_atoms = 0
+    prev_residue = (-1, -1, -1, -1)
+    first_altloc = 0
+
+    pos = 0
+    size = len(buf)
+    while pos < size:
+        end = pos
+        while end < size and buf[end] != _NEWLINE:
+            end += 1
+        line_end = end
+        if line_end > pos and buf[line_end - 1] == _CR:
+            line_end -= 1
+
+        if _starts_with(buf, pos, line_end, endmdl_record):
+            break
+
+        is_hetatm = _starts_with(buf, pos, line_end, hetatm_record)
+        if (is_hetatm or _starts_with(buf, pos, line_end, atom_record)) and line_end - pos >= 54:
+            chain = _pack(buf, pos, line_end, 21, 22)
+            resseq = _parse_int(buf, pos, line_end, 22, 26)
+            icode = _pack(buf, pos, line_end, 26, 27)
+            res_name = _pack(buf, pos, line_end, 17, 20)
+
+            residue = (chain, resseq, icode, res_name)
+            if residue != prev_residue:
+                prev_residue = residue
+                first_altloc = 0
+
+            keep = True
+            altloc = _column(buf, pos, line_end, 16)
+            if altloc != _SPACE:
+                is_letter = (65 <= altloc <= 90) or (97 <= altloc <= 122)
+                if not is_letter:
+                    keep = False
+                elif first_altloc == 0:
+                    first_altloc = altloc
+                elif altloc != first_altloc:
+                    keep = False
+
+            if keep:
+                coord[num_atoms, 0] = _parse_float(buf, pos, line_end, 30, 38)
+                coord[num_atoms, 1] = _parse_float(buf, pos, line_end, 38, 46)
+                coord[num_atoms, 2] = _parse_float(buf, pos, line_end, 46, 54)
+                occupancy[num_atoms] = _parse_float(buf, pos, line_end, 54, 60)
+                b_factor[num_atoms] = _parse_float(buf, pos, line_end, 60, 66)
+                res_id[num_atoms] = resseq
+                hetero[num_atoms] = is_hetatm
+                chain_code[num_atoms] = chain
+                ins_code[num_atoms] = icode
+                res_name_code[num_atoms] = res_name
+                atom_name_code[num_atoms] = _pack(buf, pos, line_end, 12, 16)
+                element_code[num_atoms] = _pack(buf, pos, line_end, 76, 78)
+                num_atoms += 1
+
+        pos = end + 1
+
+    return num_atoms
+
+def decode_codes(codes: np.ndarray, dtype: str) -> np.ndarray:
+    """Turn packed column codes back into stripped strings, decoding each distinct code once"""
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    names = [int(code).to_bytes(4, 'big').decode('ascii', 'replace').strip(' \x00')
+             for code in unique_codes]
+    return np.array(names, dtype=dtype)[inverse.reshape(-1)]
+
+def infer_elements(atom_name: np.ndarray, element: np.ndarray) -> None:
+    """Fill blank element columns with the first letter of the atom name"""
+    missing = element == ''
+    if missing.any():
+        names, inverse = np.unique(atom_name[missing], return_inverse=True)
+        guessed = [next((c for c in name if c.isalpha()), '') for name in names]
+        element[missing] = np.array(guessed, dtype=element.dtype)[inverse.reshape(-1)]
+
+def read_atom_arrays(pdb_file: Path) -> Dict[str, np.ndarray]:
+    """Read the first model of a PDB file into per-atom arrays"""
+    with open(pdb_file, 'rb') as f:
+        data = f.read()
+
+    max_atoms = data.count(b'\nATOM') + data.count(b'\nHETATM') + 1
+    coord = np.zeros((max_atoms, 3), dtype=np.float32)
+    res_id = np.zeros(max_atoms, dtype=np.int64)
+    occupancy = np.zeros(max_atoms, dtype=np.float32)
+    b_factor = np.zeros(max_atoms, dtype=np.float32)
+    hetero = np.zeros(max_atoms, dtype=bool)
+    codes = np.zeros((5, max_atoms), dtype=np.uint32)
+
+    num_atoms = parse_atoms(np.frombuffer(data, dtype=np.uint8), coord, res_id, occupancy, b_factor, hetero,
+                            codes[0], codes[1], codes[2], codes[3], codes[4])
+    chain_code, ins_code, res_name_code, atom_name_code, element_code = codes[:, :num_atoms]
+    atom_name = decode_codes(atom_name_code, 'U6')
+    element = decode_codes(element_code, 'U2')
+    infer_elements(atom_name, element)
+
+    return {
+        'coord': coord[:num_atoms],
+        'chain_id': decode_codes(chain_code, 'U4'),
+        'res_id': res_id[:num_atoms],
+        'ins_code': decode_codes(ins_code, 'U1'),
+        'res_name': decode_codes(res_name_code, 'U5'),
+        'atom_name': atom_name,
+        'element': element,
+        'hetero': hetero[:num_atoms],
+        'occupancy': occupancy[:num_atoms],
+        'b_factor': b_factor[:num_atoms],
+    }
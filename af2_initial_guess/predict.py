@@ -6,49 +6,49 @@ import sys
 
 from timeit import default_timer as timer
 import argparse
-import glob
+import logging
 import uuid
 
-import jax
-import jax.numpy as jnp
-
-from jax.lib import xla_bridge
-
-from alphafold.common import residue_constants
-from alphafold.common import protein
-from alphafold.common import confidence
-from alphafold.data import pipeline
-from alphafold.model import data
-from alphafold.model import config
-from alphafold.model import model
-
-import af2_util
-
 parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(parent, 'include'))
 from silent_tools import silent_tools
 
 # PyRosetta imports removed - using SimpleStructure instead
-from simple_structure import SimpleStructure, load_from_pdb_dir, load_from_pdb_list
+from simple_structure import SimpleStructure, list_pdb_files, load_from_pdb_dir, load_from_pdb_list, PDB_BACKEND
 from robust_structure_handler import RobustStructureHandler, prepare_structure_for_af2
 
-# Try to import BioPython
-try:
-    from Bio.PDB import PDBParser, PDBIO
-    BIOPYTHON_AVAILABLE = True
-except ImportError:
-    print("Warning: BioPython not available. Install with: pip install biopython")
-    BIOPYTHON_AVAILABLE = False
-
-# Check if PyRosetta is available for silent file fallback
-try:
-    from pyrosetta import *
-    from rosetta import *
-    init( '-in:file:silent_struct_type binary -mute all' )
-    PYROSETTA_AVAILABLE = True
-except ImportError:
-    print("Warning: PyRosetta not available. Silent files will not work without PyRosetta.")
-    PYROSETTA_AVAILABLE = False
+# SimpleStructure needs fastpdb, numba or BioPython to read PDB files
+PDB_PARSER_AVAILABLE = PDB_BACKEND is not None
+if not PDB_PARSER_AVAILABLE:
+    print("Warning: No PDB parser available. Install with: pip install fastpdb (or numba)")
+
+if __name__ == '__main__':
+    # JAX, AlphaFold and PyRosetta are only needed for running predictions,
+    # so build_parser() can be imported without loading them
+    import jax
+    import jax.numpy as jnp
+
+    from jax.lib import xla_bridge
+
+    from alphafold.common import residue_constants
+    from alphafold.common import protein
+    from alphafold.common import confidence
+    from alphafold.data import pipeline
+    from alphafold.model import data
+    from alphafold.model import config
+    from alphafold.model import model
+
+    import af2_util
+
+    # Check if PyRosetta is available for silent file fallback
+    try:
+        from pyrosetta import *
+        from rosetta import *
+        init( '-in:file:silent_struct_type binary -mute all' )
+        PYROSETTA_AVAILABLE = True
+    except ImportError:
+        print("Warning: PyRosetta not available. Silent files will not work without PyRosetta.")
+        PYROSETTA_AVAILABLE = False
 
 def range1(size): return range(1, size+1)
 
@@ -56,34 +56,38 @@ def range1(size): return range(1, size+1)
 # Parse Arguments
 #################################
 
-parser = argparse.ArgumentParser()
-
-# I/O Arguments
-parser.add_argument( "-pdbdir", type=str, default="", help='The name of a directory of pdbs to run through the model' )
-parser.add_argument( "-silent", type=str, default="", help='The name of a silent file to run through the model' )
-parser.add_argument( "-outpdbdir", type=str, default="outputs", help='The directory to which the output PDB files will be written. Only used when -pdbdir is active' )
-parser.add_argument( "-outsilent", type=str, default="out.silent", help='The name of the silent file to which output structs will be written. Only used when -silent is active' )
-parser.add_argument( "-runlist", type=str, default='', help="The path of a list of pdb tags to run. Only used when -pdbdir is active (default: ''; Run all PDBs)" )
-parser.add_argument( "-checkpoint_name", type=str, default='check.point', help="The name of a file where tags which have finished will be written (default: check.point)" )
-parser.add_argument( "-scorefilename", type=str, default='out.sc', help="The name of a file where scores will be written (default: out.sc)" )
-parser.add_argument( "-maintain_res_numbering", action="store_true", default=False, help='When active, the model will not renumber the residues when bad inputs are encountered (default: False)' )
-
-# Enhanced Structure Handling Arguments
-parser.add_argument( "-binder_chain", type=str, default="", help='Chain ID of the binder (e.g., A). If not specified, auto-detection will be used' )
-parser.add_argument( "-target_chain", type=str, default="", help='Chain ID of the target (e.g., B). If not specified, auto-detection will be used' )
-parser.add_argument( "-auto_renumber", action="store_true", default=True, help='Automatically renumber residues to ensure uniqueness (default: True)' )
-parser.add_argument( "-auto_clean", action="store_true", default=True, help='Automatically clean structure (remove waters, hetero atoms) (default: True)' )
-parser.add_argument( "-strict_validation", action="store_true", default=False, help='Fail on any structure validation warnings (default: False)' )
-
-parser.add_argument( "-debug", action="store_true", default=False, help='When active, errors will cause the script to crash and the error message to be printed out (default: False)')
-
-# AF2-Specific Arguments
-parser.add_argument( "-max_amide_dist", type=float, default=3.0, help='The maximum distance between an amide bond\'s carbon and nitrogen (default: 3.0)' )
-parser.add_argument( "-recycle", type=int, default=3, help='The number of AF2 recycles to perform (default: 3)' )
-parser.add_argument( "-no_initial_guess", action="store_true", default=False, help='When active, the model will not use an initial guess (default: False)' )
-parser.add_argument( "-force_monomer", action="store_true", default=False, help='When active, the model will predict the structure of a monomer (default: False)' )
-
-args = parser.parse_args()
+def build_parser() -> argparse.ArgumentParser:
+    '''
+    Build the command line parser for AF2 prediction
+    '''
+    parser = argparse.ArgumentParser()
+
+    # I/O Arguments
+    parser.add_argument( "-pdbdir", type=str, default="", help='The name of a directory of pdbs to run through the model' )
+    parser.add_argument( "-silent", type=str, default="", help='The name of a silent file to run through the model' )
+    parser.add_argument( "-outpdbdir", type=str, default="outputs", help='The directory to which the output PDB files will be written. Only used when -pdbdir is active' )
+    parser.add_argument( "-outsilent", type=str, default="out.silent", help='The name of the silent file to which output structs will be written. Only used when -silent is active' )
+    parser.add_argument( "-runlist", type=str, default='', help="The path of a list of pdb tags to run. Only used when -pdbdir is active (default: ''; Run all PDBs)" )
+    parser.add_argument( "-checkpoint_name", type=str, default='check.point', help="The name of a file where tags which have finished will be written (default: check.point)" )
+    parser.add_argument( "-scorefilename", type=str, default='out.sc', help="The name of a file where scores will be written (default: out.sc)" )
+    parser.add_argument( "-maintain_res_numbering", action="store_true", default=False, help='When active, the model will not renumber the residues when bad inputs are encountered (default: False)' )
+
+    # Enhanced Structure Handling Arguments
+    parser.add_argument( "-binder_chain", type=str, default="", help='Chain ID of the binder (e.g., A). If not specified, auto-detection will be used' )
+    parser.add_argument( "-target_chain", type=str, default="", help='Chain ID of the target (e.g., B). If not specified, auto-detection will be used' )
+    parser.add_argument( "-auto_renumber", action="store_true", default=True, help='Automatically renumber residues to ensure uniqueness (default: True)' )
+    parser.add_argument( "-auto_clean", action="store_true", default=True, help='Automatically clean structure (remove waters, hetero atoms) (default: True)' )
+    parser.add_argument( "-strict_validation", action="store_true", default=False, help='Fail on any structure validation warnings (default: False)' )
+
+    parser.add_argument( "-debug", action="store_true", default=False, help='When active, errors will cause the script to crash and the error message to be printed out (default: False)')
+
+    # AF2-Specific Arguments
+    parser.add_argument( "-max_amide_dist", type=float, default=3.0, help='The maximum distance between an amide bond\'s carbon and nitrogen (default: 3.0)' )
+    parser.add_argument( "-recycle", type=int, default=3, help='The number of AF2 recycles to perform (default: 3)' )
+    parser.add_argument( "-no_initial_guess", action="store_true", default=False, help='When active, the model will not use an initial guess (default: False)' )
+    parser.add_argument( "-force_monomer", action="store_true", default=False, help='When active, the model will predict the structure of a monomer (default: False)' )
+
+    return parser
 
 class FeatureHolder():
     '''
@@ -367,7 +371,7 @@ class StructManager():
             self.pdbdir    = args.pdbdir
             self.outpdbdir = args.outpdbdir
 
-            self.struct_iterator = glob.glob(os.path.join(args.pdbdir, '*.pdb'))
+            self.struct_iterator = list_pdb_files(args.pdbdir)
 
             # Parse the runlist and determine which structures to process
             if args.runlist != '':
@@ -518,7 +522,7 @@ class StructManager():
             raise Exception('Neither pdb nor silent is set to True. Cannot load pose')
 
         if self.pdb:
-            if BIOPYTHON_AVAILABLE:
+            if PDB_PARSER_AVAILABLE:
                 # Use robust structure handler for better edge case handling
                 binder_chain = args.binder_chain if args.binder_chain else None
                 target_chain = args.target_chain if args.target_chain else None
@@ -543,7 +547,7 @@ class StructManager():
             elif PYROSETTA_AVAILABLE:
                 pose = pose_from_pdb(tag)
             else:
-                raise Exception("Neither BioPython nor PyRosetta available for PDB loading")
+                raise Exception("Neither a PDB parser (fastpdb, numba, BioPython) nor PyRosetta available for PDB loading")
             usetag = '.'.join(os.path.basename(tag).split('.')[:-1])
         
         if self.silent:
@@ -601,39 +605,51 @@ class StructManager():
 ####### Main #######
 ####################
 
-device = xla_bridge.get_backend().platform
-if device == 'gpu':
-    print('/' * 60)
-    print('/' * 60)
-    print('Found GPU and will use it to run AF2')
-    print('/' * 60)
-    print('/' * 60)
-    print('\n')
-else:
-    print('/' * 60)
-    print('/' * 60)
-    print('WARNING! No GPU detected running AF2 on CPU')
-    print('/' * 60)
-    print('/' * 60)
-    print('\n')
-
-struct_manager = StructManager(args)
-af2_runner     = AF2_runner(args, struct_manager)
-
-for pdb in struct_manager.iterate():
-
-    if args.debug: af2_runner.process_struct(pdb)
-
-    else: # When not in debug mode the script will continue to run even when some poses fail
-        t0 = timer()
-
-        try: af2_runner.process_struct(pdb)
-
-        except KeyboardInterrupt: sys.exit( "Script killed by Control+C, exiting" )
-
-        except:
-            seconds = int(timer() - t0)
-            print( "Struct with tag %s failed in %i seconds with error: %s"%( pdb, seconds, sys.exc_info()[0] ) )
-
-    # We are done with one pdb, record that we finished
-    struct_manager.record_checkpoint(pdb)
+if __name__ == '__main__':
+    args = build_parser().parse_args()
+
+    # Structure preparation reports its progress through logging; give that
+    # logger its own stdout handler so the root logger (and JAX/absl) stay untouched
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    structure_log = logging.getLogger('robust_structure_handler')
+    structure_log.addHandler(handler)
+    structure_log.setLevel(logging.INFO)
+    structure_log.propagate = False
+
+    device = xla_bridge.get_backend().platform
+    if device == 'gpu':
+        print('/' * 60)
+        print('/' * 60)
+        print('Found GPU and will use it to run AF2')
+        print('/' * 60)
+        print('/' * 60)
+        print('\n')
+    else:
+        print('/' * 60)
+        print('/' * 60)
+        print('WARNING! No GPU detected running AF2 on CPU')
+        print('/' * 60)
+        print('/' * 60)
+        print('\n')
+
+    struct_manager = StructManager(args)
+    af2_runner     = AF2_runner(args, struct_manager)
+
+    for pdb in struct_manager.iterate():
+
+        if args.debug: af2_runner.process_struct(pdb)
+
+        else: # When not in debug mode the script will continue to run even when some poses fail
+            t0 = timer()
+
+            try: af2_runner.process_struct(pdb)
+
+            except KeyboardInterrupt: sys.exit( "Script killed by Control+C, exiting" )
+
+            except:
+                seconds = int(timer() - t0)
+                print( "Struct with tag %s failed in %i seconds with error: %s"%( pdb, seconds, sys.exc_info()[0] ) )
+
+        # We are done with one pdb, record that we finished
+        struct_manager.record_checkpoint(pdb)
@@ -4,24 +4,18 @@ Robust structure handling for AF2 predictions
 Handles edge cases like PDB numbering, chain order, and structural irregularities
 """
 
+import logging
 import numpy as np
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Union
-from Bio.PDB import PDBParser, PDBIO, Select
-from Bio.PDB.Structure import Structure as BioPDBStructure
-from Bio.PDB.Model import Model
-from Bio.PDB.Chain import Chain
-from Bio.PDB.Residue import Residue
 import warnings
-import re
 from simple_structure import SimpleStructure
 
+log = logging.getLogger(__name__)
+
 class RobustStructureHandler:
     """Enhanced structure handler that deals with real-world PDB edge cases"""
     
-    def __init__(self):
-        self.parser = PDBParser(QUIET=True)
-        
     def auto_detect_binder_target(self, structure: SimpleStructure, 
                                  binder_length_threshold: int = 150) -> Tuple[int, int]:
         """
@@ -77,23 +71,7 @@ class RobustStructureHandler:
     
     def _renumber_single_chain(self, structure: SimpleStructure) -> SimpleStructure:
         """Renumber single chain consecutively starting from 1"""
-        new_structure = structure.structure.copy()
-        
-        res_num = 1
-        for model in new_structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        residue.id = (' ', res_num, ' ')
-                        res_num += 1
-        
-        # Create temporary file for renumbered structure
-        temp_file = f"/tmp/renumbered_{structure.pdb_file.stem}.pdb"
-        io = PDBIO()
-        io.set_structure(new_structure)
-        io.save(temp_file)
-        
-        return SimpleStructure(temp_file)
+        return self._renumber_chain_section(structure, start_num=1)
     
     def _renumber_complex(self, chains: List[SimpleStructure], 
                          binder_idx: int, target_idx: int) -> SimpleStructure:
@@ -115,48 +93,31 @@ class RobustStructureHandler:
     
     def _renumber_chain_section(self, chain_structure: SimpleStructure, start_num: int) -> SimpleStructure:
         """Renumber a single chain starting from specified number"""
-        new_structure = chain_structure.structure.copy()
-        
-        res_num = start_num
-        for model in new_structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        residue.id = (' ', res_num, ' ')
-                        res_num += 1
+        arrays = chain_structure.arrays()
+        res_id = arrays['res_id'].copy()
+        ins_code = arrays['ins_code'].copy()
         
-        # Create temporary file
-        temp_file = f"/tmp/chain_renumbered_{start_num}.pdb"
-        io = PDBIO()
-        io.set_structure(new_structure)
-        io.save(temp_file)
+        # Only standard residues are renumbered, hetero residues keep their numbers
+        standard = ~chain_structure.hetero
+        res_id[standard] = chain_structure.res_idx[standard] + start_num
+        ins_code[standard] = ''
         
-        return SimpleStructure(temp_file)
+        arrays.update(res_id=res_id, ins_code=ins_code)
+        return SimpleStructure.from_arrays(chain_structure.pdb_file, arrays)
     
     def _combine_chains(self, binder: SimpleStructure, target: SimpleStructure) -> SimpleStructure:
         """Combine binder and target into single structure"""
-        # Create new structure
-        combined_structure = BioPDBStructure("combined")
-        model = Model(0)
-        combined_structure.add(model)
-        
-        # Add binder chain (rename to A)
-        binder_chain = list(binder.structure.get_chains())[0].copy()
-        binder_chain.id = 'A'
-        model.add(binder_chain)
+        binder_atoms = binder.arrays()
+        target_atoms = target.arrays()
         
-        # Add target chain (rename to B)  
-        target_chain = list(target.structure.get_chains())[0].copy()
-        target_chain.id = 'B'
-        model.add(target_chain)
+        # Binder becomes chain A, target becomes chain B
+        binder_atoms['chain_id'] = np.full(binder.natoms, 'A')
+        target_atoms['chain_id'] = np.full(target.natoms, 'B')
         
-        # Save combined structure
-        temp_file = "/tmp/combined_structure.pdb"
-        io = PDBIO()
-        io.set_structure(combined_structure)
-        io.save(temp_file)
+        combined = {field: np.concatenate([binder_atoms[field], target_atoms[field]])
+                    for field in binder_atoms}
         
-        return SimpleStructure(temp_file)
+        return SimpleStructure.from_arrays(binder.pdb_file, combined)
     
     def _find_chains_by_id(self, chains: List[SimpleStructure], 
                           binder_id: str, target_id: str) -> Tuple[int, int]:
@@ -164,7 +125,7 @@ class RobustStructureHandler:
         binder_idx = target_idx = None
         
         for i, chain_struct in enumerate(chains):
-            chain_id = list(chain_struct.structure.get_chains())[0].get_id()
+            chain_id = chain_struct.chain_ids()[0]
             if chain_id == binder_id:
                 binder_idx = i
             elif chain_id == target_id:
@@ -207,16 +168,14 @@ class RobustStructureHandler:
                 'index': i,
                 'length': chain.size(),
                 'sequence': chain.sequence(),
-                'residue_numbers': [res['number'] for res in chain.residues]
+                'residue_numbers': chain.residue_numbers()
             }
             
             # Check for residue gaps
             res_numbers = chain_info['residue_numbers']
-            if res_numbers:
-                gaps = []
-                for j in range(len(res_numbers) - 1):
-                    if res_numbers[j+1] - res_numbers[j] > 1:
-                        gaps.append((res_numbers[j], res_numbers[j+1]))
+            if len(res_numbers) > 0:
+                gap_idx = np.flatnonzero(np.diff(res_numbers) > 1)
+                gaps = [(int(res_numbers[j]), int(res_numbers[j+1])) for j in gap_idx]
                 
                 if gaps:
                     chain_info['gaps'] = gaps
@@ -224,8 +183,9 @@ class RobustStructureHandler:
                     report['warnings'].append(f"Chain {i}: Found residue gaps: {gaps}")
             
             # Check for duplicate residue numbers
-            if len(set(res_numbers)) != len(res_numbers):
-                duplicates = [x for x in set(res_numbers) if res_numbers.count(x) > 1]
+            numbers, counts = np.unique(res_numbers, return_counts=True)
+            if len(numbers) != len(res_numbers):
+                duplicates = numbers[counts > 1].tolist()
                 report['errors'].append(f"Chain {i}: Duplicate residue numbers: {duplicates}")
                 report['valid'] = False
             
@@ -233,12 +193,11 @@ class RobustStructureHandler:
         
         # Check for overlapping residue numbers between chains
         if len(chains) == 2:
-            chain1_nums = set(report['chain_info'][0]['residue_numbers'])
-            chain2_nums = set(report['chain_info'][1]['residue_numbers'])
-            overlap = chain1_nums & chain2_nums
+            overlap = np.intersect1d(report['chain_info'][0]['residue_numbers'],
+                                     report['chain_info'][1]['residue_numbers']).tolist()
             
             if overlap:
-                report['errors'].append(f"Overlapping residue numbers between chains: {sorted(overlap)}")
+                report['errors'].append(f"Overlapping residue numbers between chains: {overlap}")
                 report['valid'] = False
         
         return report
@@ -255,40 +214,31 @@ class RobustStructureHandler:
             remove_hetero: Remove hetero atoms (ligands, etc.)
             keep_only_ca: Keep only CA atoms (for backbone-only predictions)
         """
+        keep = np.ones(structure.natoms, dtype=bool)
         
-        class CleanSelect(Select):
-            def accept_residue(self, residue):
-                # Remove water
-                if remove_waters and residue.get_resname() in ['HOH', 'WAT']:
-                    return False
-                
-                # Remove hetero atoms
-                if remove_hetero and residue.get_id()[0] != ' ':
-                    return False
-                
-                return True
-            
-            def accept_atom(self, atom):
-                # Keep only CA atoms if requested
-                if keep_only_ca:
-                    return atom.get_name() == 'CA'
-                
-                # Standard protein atoms
-                return atom.get_name() in ['N', 'CA', 'C', 'O', 'CB']
+        # Remove water
+        if remove_waters:
+            keep &= ~np.isin(structure.res_name, ['HOH', 'WAT'])
         
-        # Apply cleaning
-        temp_file = "/tmp/cleaned_structure.pdb"
-        io = PDBIO()
-        io.set_structure(structure.structure)
-        io.save(temp_file, CleanSelect())
+        # Remove hetero atoms
+        if remove_hetero:
+            keep &= ~structure.hetero
         
-        return SimpleStructure(temp_file)
+        if keep_only_ca:
+            # Keep only CA atoms if requested
+            keep &= structure.atom_name == 'CA'
+        else:
+            # Standard protein atoms
+            keep &= np.isin(structure.atom_name, ['N', 'CA', 'C', 'O', 'CB'])
+        
+        return structure.select(keep)
 
-def prepare_structure_for_af2(pdb_file: Union[str, Path],
+def prepare_structure_for_af2(pdb_file: Optional[Union[str, Path]] = None,
                              binder_chain: Optional[str] = None,
                              target_chain: Optional[str] = None,
                              auto_clean: bool = True,
-                             auto_renumber: bool = True) -> SimpleStructure:
+                             auto_renumber: bool = True,
+                             structure: Optional[SimpleStructure] = None) -> SimpleStructure:
     """
     High-level function to prepare any PDB structure for AF2 prediction
     
@@ -298,58 +248,64 @@ def prepare_structure_for_af2(pdb_file: Union[str, Path],
         target_chain: Chain ID of target (if known)  
         auto_clean: Remove waters and non-standard residues
         auto_renumber: Automatically renumber residues for AF2 compatibility
+        structure: Already loaded structure to prepare instead of pdb_file
         
     Returns:
         Cleaned and renumbered SimpleStructure ready for AF2
     """
     
+    if (pdb_file is None) == (structure is None):
+        raise ValueError("Specify exactly one of pdb_file or structure")
+    
     handler = RobustStructureHandler()
     
     # Load structure
-    structure = SimpleStructure(str(pdb_file))
-    print(f"📁 Loaded structure: {pdb_file}")
-    print(f"   Chains: {len(structure.split_by_chain())}")
-    print(f"   Total residues: {structure.size()}")
+    if structure is None:
+        structure = SimpleStructure(str(pdb_file))
+    log.info("📁 Loaded structure: %s", structure.pdb_file)
+    log.info("   Chains: %d", len(structure.chain_ids()))
+    log.info("   Total residues: %d", structure.size())
     
     # Validate structure
     validation = handler.validate_structure(structure)
     
     if not validation['valid']:
-        print("❌ Structure validation failed:")
+        log.error("❌ Structure validation failed:")
         for error in validation['errors']:
-            print(f"   Error: {error}")
+            log.error("   Error: %s", error)
         raise ValueError("Structure has critical errors. Please fix manually.")
     
     if validation['warnings']:
-        print("⚠️  Structure warnings:")
+        log.warning("⚠️  Structure warnings:")
         for warning in validation['warnings']:
-            print(f"   Warning: {warning}")
+            log.warning("   Warning: %s", warning)
     
     # Clean structure if requested
     if auto_clean:
-        print("🧹 Cleaning structure...")
+        log.info("🧹 Cleaning structure...")
         structure = handler.clean_structure(structure, 
                                           remove_waters=True,
                                           remove_hetero=True)
-        print(f"   Residues after cleaning: {structure.size()}")
+        log.info("   Residues after cleaning: %d", structure.size())
     
     # Renumber structure if requested
     if auto_renumber:
-        print("🔢 Renumbering structure...")
+        log.info("🔢 Renumbering structure...")
         structure = handler.renumber_structure(structure, binder_chain, target_chain)
         
         # Validate renumbering
         validation_after = handler.validate_structure(structure)
         if validation_after['valid']:
-            print("✅ Structure successfully prepared for AF2")
+            log.info("✅ Structure successfully prepared for AF2")
             
-            # Print chain summary
+            # Log chain summary
             for chain_info in validation_after['chain_info']:
-                print(f"   Chain {chain_info['index']}: {chain_info['length']} residues "
-                      f"(residues {min(chain_info['residue_numbers'])}-{max(chain_info['residue_numbers'])})")
+                res_numbers = chain_info['residue_numbers']
+                log.info("   Chain %d: %d residues (residues %d-%d)", chain_info['index'],
+                         chain_info['length'], res_numbers.min(), res_numbers.max())
         else:
-            print("❌ Renumbering failed:")
+            log.error("❌ Renumbering failed:")
             for error in validation_after['errors']:
-                print(f"   Error: {error}")
+                log.error("   Error: %s", error)
     
     return structure
\ No newline at end of file
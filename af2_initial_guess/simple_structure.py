@@ -1,202 +1,436 @@
 #!/usr/bin/env python3
 """
 Simple structure handling without PyRosetta dependency
-Uses BioPython for PDB parsing and manipulation
+Uses fastpdb (Biotite) or the numba PDB reader (pdb_fastparse) for PDB parsing,
+with BioPython as a fallback, and stores the structure as per-atom NumPy arrays
 """
 
+import os
+import functools
+import math
+import multiprocessing as mp
 import numpy as np
+from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from Bio.PDB import PDBParser, PDBIO, Select
-from Bio.PDB.Structure import Structure as BioPDBStructure
-from Bio.PDB.Model import Model
-from Bio.PDB.Chain import Chain
-from Bio.PDB.Residue import Residue
+from typing import List, Dict, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore', category=UserWarning)
 
+# fastpdb and the numba reader both parse PDB columns straight into NumPy arrays.
+# fastpdb comes first since the numba reader pays a JIT compile (or cache load)
+# in every new process; BioPython is only used when neither is installed
+try:
+    import fastpdb
+    FASTPDB_AVAILABLE = True
+except ImportError:
+    FASTPDB_AVAILABLE = False
+
+if FASTPDB_AVAILABLE:
+    PDB_BACKEND = 'fastpdb'
+else:
+    # Only load the numba reader (and numba itself) when fastpdb is missing
+    import pdb_fastparse
+    if pdb_fastparse.NUMBA_AVAILABLE:
+        PDB_BACKEND = 'numba'
+    else:
+        try:
+            from Bio.PDB import PDBParser
+            PDB_BACKEND = 'biopython'
+        except ImportError:
+            PDB_BACKEND = None
+
+AA_3TO1 = {
+    'ALA': 'A', 'ARG': 'R', 'ASN': 'N', 'ASP': 'D', 'CYS': 'C',
+    'GLN': 'Q', 'GLU': 'E', 'GLY': 'G', 'HIS': 'H', 'ILE': 'I',
+    'LEU': 'L', 'LYS': 'K', 'MET': 'M', 'PHE': 'F', 'PRO': 'P',
+    'SER': 'S', 'THR': 'T', 'TRP': 'W', 'TYR': 'Y', 'VAL': 'V'
+}
+
+# Per-atom arrays held by every SimpleStructure
+ATOM_FIELDS = ('coord', 'chain_id', 'res_id', 'ins_code', 'res_name',
+               'atom_name', 'element', 'hetero', 'occupancy', 'b_factor')
+
+# Read-only snapshot of the per-atom arrays of one parsed PDB file
+ParsedAtoms = namedtuple('ParsedAtoms', ATOM_FIELDS)
+
+def _empty_atom_arrays() -> Dict[str, np.ndarray]:
+    """Per-atom arrays of a structure without atoms"""
+    return {
+        'coord': np.zeros((0, 3), dtype=np.float32),
+        'chain_id': np.zeros(0, dtype='U4'),
+        'res_id': np.zeros(0, dtype=np.int64),
+        'ins_code': np.zeros(0, dtype='U1'),
+        'res_name': np.zeros(0, dtype='U5'),
+        'atom_name': np.zeros(0, dtype='U6'),
+        'element': np.zeros(0, dtype='U2'),
+        'hetero': np.zeros(0, dtype=bool),
+        'occupancy': np.zeros(0, dtype=np.float32),
+        'b_factor': np.zeros(0, dtype=np.float32),
+    }
+
+def _read_with_fastpdb(pdb_file: Path) -> Dict[str, np.ndarray]:
+    """Read the first model of a PDB file with fastpdb"""
+    pdb = fastpdb.PDBFile.read(str(pdb_file))
+    # Files without ATOM/HETATM records have no models; the other backends return no atoms
+    if pdb.get_model_count() == 0:
+        return _empty_atom_arrays()
+    atoms = pdb.get_structure(model=1, extra_fields=['occupancy', 'b_factor'])
+    return {
+        'coord': atoms.coord.astype(np.float32),
+        'chain_id': atoms.chain_id,
+        'res_id': atoms.res_id.astype(np.int64),
+        'ins_code': atoms.ins_code,
+        'res_name': atoms.res_name,
+        'atom_name': atoms.atom_name,
+        'element': atoms.element,
+        'hetero': atoms.hetero,
+        'occupancy': atoms.occupancy.astype(np.float32),
+        'b_factor': atoms.b_factor.astype(np.float32),
+    }
+
+def _read_with_biopython(pdb_file: Path) -> Dict[str, np.ndarray]:
+    """Read the first model of a PDB file with BioPython"""
+    structure = PDBParser(QUIET=True).get_structure('protein', str(pdb_file))
+    model = next(iter(structure), [])
+
+    columns = {field: [] for field in ATOM_FIELDS}
+    for chain in model:
+        for residue in chain:
+            hetfield, resseq, icode = residue.get_id()
+            for atom in residue:
+                columns['coord'].append(atom.get_coord())
+                columns['chain_id'].append(chain.get_id())
+                columns['res_id'].append(resseq)
+                columns['ins_code'].append(icode.strip())
+                columns['res_name'].append(residue.get_resname())
+                columns['atom_name'].append(atom.get_name())
+                columns['element'].append(atom.element)
+                columns['hetero'].append(hetfield != ' ')
+                columns['occupancy'].append(atom.get_occupancy() or 0.0)
+                columns['b_factor'].append(atom.get_bfactor())
+
+    return {
+        'coord': np.array(columns['coord'], dtype=np.float32).reshape(-1, 3),
+        'chain_id': np.array(columns['chain_id'], dtype='U4'),
+        'res_id': np.array(columns['res_id'], dtype=np.int64),
+        'ins_code': np.array(columns['ins_code'], dtype='U1'),
+        'res_name': np.array(columns['res_name'], dtype='U5'),
+        'atom_name': np.array(columns['atom_name'], dtype='U6'),
+        'element': np.array(columns['element'], dtype='U2'),
+        'hetero': np.array(columns['hetero'], dtype=bool),
+        'occupancy': np.array(columns['occupancy'], dtype=np.float32),
+        'b_factor': np.array(columns['b_factor'], dtype=np.float32),
+    }
+
+def read_pdb_arrays(pdb_file: Path) -> Dict[str, np.ndarray]:
+    """Parse a PDB file into per-atom arrays using the best available backend"""
+    if PDB_BACKEND == 'fastpdb':
+        return _read_with_fastpdb(pdb_file)
+    if PDB_BACKEND == 'numba':
+        return pdb_fastparse.read_atom_arrays(pdb_file)
+    if PDB_BACKEND == 'biopython':
+        return _read_with_biopython(pdb_file)
+    raise ImportError("No PDB parser available. Install with: pip install fastpdb (or numba)")
+
+@functools.lru_cache(maxsize=None)
+def _atom37_table() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sorted AF2 atom37 names and their slots, for vectorized atom name lookup
+    Built on first use so parsing PDB files does not need the alphafold package
+    """
+    from alphafold.common import residue_constants
+    names = np.array(sorted(residue_constants.atom_types))
+    slots = np.array([residue_constants.atom_order[name] for name in names], dtype=np.int8)
+    return names, slots
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(pdb_file: str, file_key: Tuple[int, int]) -> ParsedAtoms:
+    """
+    Parse a PDB file once per (path, mtime, size)
+    The arrays are shared between structures, so they are made read-only
+    """
+    arrays = read_pdb_arrays(Path(pdb_file))
+    for array in arrays.values():
+        array.setflags(write=False)
+    return ParsedAtoms(**arrays)
+
 class SimpleStructure:
-    """Simple structure class to replace PyRosetta pose functionality"""
-    
+    """
+    Simple structure class to replace PyRosetta pose functionality
+    Arrays loaded from a PDB file are shared read-only with other structures
+    of the same file; copy an array before modifying it
+    """
+
     def __init__(self, pdb_file: str):
         """Initialize from PDB file"""
         self.pdb_file = Path(pdb_file)
-        self.parser = PDBParser(QUIET=True)
-        self.structure = self.parser.get_structure('protein', str(pdb_file))
-        
-        # Extract basic information
-        self.sequence_str = self._extract_sequence()
-        self.atoms = self._extract_atoms()
-        self.residues = self._extract_residues()
-        
-    def _extract_sequence(self) -> str:
-        """Extract amino acid sequence from structure"""
-        aa_dict = {
-            'ALA': 'A', 'ARG': 'R', 'ASN': 'N', 'ASP': 'D', 'CYS': 'C',
-            'GLN': 'Q', 'GLU': 'E', 'GLY': 'G', 'HIS': 'H', 'ILE': 'I',
-            'LEU': 'L', 'LYS': 'K', 'MET': 'M', 'PHE': 'F', 'PRO': 'P',
-            'SER': 'S', 'THR': 'T', 'TRP': 'W', 'TYR': 'Y', 'VAL': 'V'
-        }
-        
-        sequence = ""
-        for model in self.structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        resname = residue.get_resname()
-                        if resname in aa_dict:
-                            sequence += aa_dict[resname]
-                        else:
-                            sequence += 'X'  # Unknown residue
-        
-        return sequence
-    
-    def _extract_atoms(self) -> np.ndarray:
-        """Extract atom coordinates as numpy array"""
-        coords = []
-        for atom in self.structure.get_atoms():
-            coords.append(atom.get_coord())
-        return np.array(coords)
-    
-    def _extract_residues(self) -> List[Dict]:
-        """Extract residue information"""
-        residues = []
-        for model in self.structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        res_info = {
-                            'name': residue.get_resname(),
-                            'number': residue.get_id()[1],
-                            'chain': chain.get_id(),
-                            'atoms': [atom.get_name() for atom in residue.get_atoms()]
-                        }
-                        residues.append(res_info)
-        return residues
-    
+        stat = os.stat(self.pdb_file)
+        parsed = _parse_cached(os.path.abspath(self.pdb_file), (stat.st_mtime_ns, stat.st_size))
+        self._set_arrays(parsed._asdict())
+
+    @classmethod
+    def from_arrays(cls, pdb_file: str, arrays: Dict[str, np.ndarray]) -> 'SimpleStructure':
+        """Build a structure from per-atom arrays without touching the disk"""
+        structure = cls.__new__(cls)
+        structure.pdb_file = Path(pdb_file)
+        structure._set_arrays(arrays)
+        return structure
+
+    def _set_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Attach per-atom arrays and index the residue boundaries"""
+        for field in ATOM_FIELDS:
+            setattr(self, field, arrays[field])
+        self._res_starts = self._find_residue_starts()
+
+        # Per-atom standard residue index
+        is_standard_start = np.zeros(self.natoms, dtype=bool)
+        is_standard_start[self._res_starts] = True
+        is_standard_start &= ~self.hetero
+        self.res_idx = np.cumsum(is_standard_start) - 1
+
+    def _find_residue_starts(self) -> np.ndarray:
+        """Indices of the first atom of every residue"""
+        num_atoms = self.natoms
+        if num_atoms == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        is_start = np.ones(num_atoms, dtype=bool)
+        is_start[1:] = ((self.chain_id[1:] != self.chain_id[:-1]) |
+                        (self.res_id[1:] != self.res_id[:-1]) |
+                        (self.ins_code[1:] != self.ins_code[:-1]) |
+                        (self.res_name[1:] != self.res_name[:-1]) |
+                        (self.hetero[1:] != self.hetero[:-1]))
+        return np.flatnonzero(is_start)
+
+    def standard_residue_spans(self) -> List[Tuple[int, int]]:
+        """(start, stop) atom ranges of standard (non-hetero) residues"""
+        starts = self._res_starts
+        stops = np.append(starts[1:], self.natoms)
+        standard = ~self.hetero[starts]
+        return list(zip(starts[standard].tolist(), stops[standard].tolist()))
+
+    def select(self, selection: Union[np.ndarray, slice]) -> 'SimpleStructure':
+        """
+        New structure holding only the atoms picked by a boolean mask or a slice
+        Slices share memory with this structure instead of copying the arrays
+        """
+        return SimpleStructure.from_arrays(self.pdb_file, {field: getattr(self, field)[selection] for field in ATOM_FIELDS})
+
+    def copy(self) -> 'SimpleStructure':
+        """Independent, writable copy of this structure"""
+        return SimpleStructure.from_arrays(self.pdb_file, {field: np.copy(getattr(self, field)) for field in ATOM_FIELDS})
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Per-atom arrays keyed by field name"""
+        return {field: getattr(self, field) for field in ATOM_FIELDS}
+
+    @property
+    def natoms(self) -> int:
+        """Number of atoms"""
+        return self.coord.shape[0]
+
+    @property
+    def residues(self) -> List[Dict]:
+        """Residue information for standard residues"""
+        return [{
+            'name': str(self.res_name[start]),
+            'number': int(self.res_id[start]),
+            'chain': str(self.chain_id[start]),
+            'atoms': self.atom_name[start:stop].tolist()
+        } for start, stop in self.standard_residue_spans()]
+
+    def residue_numbers(self) -> np.ndarray:
+        """Residue numbers of standard residues"""
+        starts = self._res_starts[~self.hetero[self._res_starts]]
+        return self.res_id[starts]
+
+    def chain_ids(self) -> List[str]:
+        """Chain IDs in order of first appearance"""
+        _, first_idx = np.unique(self.chain_id, return_index=True)
+        return self.chain_id[np.sort(first_idx)].tolist()
+
     def sequence(self) -> str:
         """Get sequence string (compatible with PyRosetta pose.sequence())"""
-        return self.sequence_str
-    
+        starts = self._res_starts[~self.hetero[self._res_starts]]
+        names, inverse = np.unique(self.res_name[starts], return_inverse=True)
+        letters = np.array([AA_3TO1.get(name, 'X') for name in names], dtype='U1')
+        return ''.join(letters[inverse])
+
     def size(self) -> int:
         """Get number of residues (compatible with PyRosetta pose.size())"""
-        return len([r for r in self.structure.get_residues() if r.get_id()[0] == ' '])
-    
+        return int(np.count_nonzero(~self.hetero[self._res_starts]))
+
     def total_residue(self) -> int:
         """Get total number of residues (compatible with PyRosetta pose.total_residue())"""
         return self.size()
-    
+
     def split_by_chain(self) -> List['SimpleStructure']:
         """Split structure by chain (compatible with PyRosetta pose.split_by_chain())"""
+        _, first_idx, inverse = np.unique(self.chain_id, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        counts = np.bincount(inverse, minlength=len(first_idx))
+
         chains = []
-        for model in self.structure:
-            for chain in model:
-                # Create new structure with single chain
-                new_structure = BioPDBStructure(f"chain_{chain.get_id()}")
-                new_model = Model(0)
-                new_structure.add(new_model)
-                
-                # Copy chain to new structure
-                chain_copy = chain.copy()
-                new_model.add(chain_copy)
-                
-                # Create temporary file for the chain
-                temp_file = f"/tmp/chain_{chain.get_id()}_{self.pdb_file.stem}.pdb"
-                io = PDBIO()
-                io.set_structure(new_structure)
-                io.save(temp_file)
-                
-                # Create SimpleStructure from temp file
-                chain_struct = SimpleStructure(temp_file)
-                chains.append(chain_struct)
-        
+        for chain in np.argsort(first_idx):
+            start, stop = first_idx[chain], first_idx[chain] + counts[chain]
+            if np.all(inverse[start:stop] == chain):
+                # Contiguous chain, take a view of the arrays
+                chains.append(self.select(slice(start, stop)))
+            else:
+                chains.append(self.select(inverse == chain))
         return chains
-    
+
     def save(self, filename: str) -> None:
         """Save structure to PDB file"""
-        io = PDBIO()
-        io.set_structure(self.structure)
-        io.save(filename)
-    
+        # Values wider than their fixed PDB column would shift every column after it
+        for field, width in (('atom_name', 4), ('res_name', 3), ('chain_id', 1)):
+            values = getattr(self, field)
+            too_long = np.char.str_len(values) > width
+            if too_long.any():
+                raise ValueError(f"{field} '{values[too_long][0]}' does not fit the {width}-character PDB column")
+        for field, low, high, decimals in (('res_id', -999, 9999, 0),
+                                           ('coord', -999.999, 9999.999, 3),
+                                           ('occupancy', -99.99, 999.99, 2),
+                                           ('b_factor', -99.99, 999.99, 2)):
+            values = np.round(getattr(self, field), decimals)
+            out_of_range = (values < low) | (values > high)
+            if out_of_range.any():
+                raise ValueError(f"{field} {values[out_of_range][0]} does not fit its PDB column "
+                                 f"({low} to {high})")
+
+        lines = []
+        serial = 0
+        for i in range(self.natoms):
+            if i > 0 and self.chain_id[i] != self.chain_id[i - 1]:
+                serial += 1
+                lines.append(self._ter_line(serial, i - 1))
+
+            serial += 1
+            atom_name = self.atom_name[i]
+            if len(atom_name) < 4 and atom_name[:1].isalpha() and len(self.element[i]) < 2:
+                atom_name = ' ' + atom_name
+            x, y, z = self.coord[i]
+            lines.append(
+                f"{'HETATM' if self.hetero[i] else 'ATOM  '}{serial % 100000:>5} {atom_name:<4} "
+                f"{self.res_name[i]:>3} {self.chain_id[i]:1}{self.res_id[i]:>4}{self.ins_code[i]:1}   "
+                f"{x:>8.3f}{y:>8.3f}{z:>8.3f}{self.occupancy[i]:>6.2f}{self.b_factor[i]:>6.2f}          "
+                f"{self.element[i]:>2}  "
+            )
+
+        if self.natoms > 0:
+            lines.append(self._ter_line(serial + 1, self.natoms - 1))
+        lines.append('END')
+
+        with open(filename, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def _ter_line(self, serial: int, atom_idx: int) -> str:
+        """TER record closing the chain of the given atom"""
+        return (f"TER   {serial % 100000:>5}      {self.res_name[atom_idx]:>3} "
+                f"{self.chain_id[atom_idx]:1}{self.res_id[atom_idx]:>4}{self.ins_code[atom_idx]:1}")
+
     def dump_pdb(self, filename: str) -> None:
         """Save structure to PDB file (compatible with PyRosetta pose.dump_pdb())"""
         self.save(filename)
-    
-    def get_atoms_for_af2(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Extract atoms in format needed for AF2 (positions and masks)"""
-        from alphafold.common import residue_constants
-        
-        # Initialize arrays
+
+    def get_atoms_for_af2(self, out: Optional[np.ndarray] = None,
+                          mask_out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Extract atoms in format needed for AF2 (positions and masks)
+        Preallocated out/mask_out buffers with at least size() rows are filled in place
+        and the returned arrays are views of their first size() rows
+        """
+        atom37_names, atom37_slots = _atom37_table()
         num_residues = self.size()
-        atom_positions = np.zeros((num_residues, residue_constants.atom_type_num, 3))
-        atom_masks = np.zeros((num_residues, residue_constants.atom_type_num))
-        
-        # Fill arrays
-        res_idx = 0
-        for model in self.structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        for atom in residue:
-                            atom_name = atom.get_name()
-                            if atom_name in residue_constants.atom_types:
-                                atom_idx = residue_constants.atom_order[atom_name]
-                                atom_positions[res_idx, atom_idx] = atom.get_coord()
-                                atom_masks[res_idx, atom_idx] = 1.0
-                        res_idx += 1
-        
+        if out is None:
+            atom_positions = np.zeros((num_residues, len(atom37_names), 3), dtype=np.float32)
+        else:
+            if len(out) < num_residues:
+                raise ValueError(f"Position buffer holds {len(out)} residues, structure has {num_residues}")
+            atom_positions = out[:num_residues]
+            atom_positions.fill(0)
+        if mask_out is None:
+            atom_masks = np.zeros((num_residues, len(atom37_names)), dtype=np.float32)
+        else:
+            if len(mask_out) < num_residues:
+                raise ValueError(f"Mask buffer holds {len(mask_out)} residues, structure has {num_residues}")
+            atom_masks = mask_out[:num_residues]
+            atom_masks.fill(0)
+
+        # Per-atom atom37 slot, -1 if not an AF2 atom
+        pos = np.minimum(np.searchsorted(atom37_names, self.atom_name), len(atom37_names) - 1)
+        atom37_idx = np.where(atom37_names[pos] == self.atom_name, atom37_slots[pos], -1)
+
+        # Scatter every AF2 atom of a standard residue into its (residue, atom37) slot
+        valid = (atom37_idx >= 0) & ~self.hetero
+        res_idx = self.res_idx[valid]
+        atom_idx = atom37_idx[valid]
+        atom_positions[res_idx, atom_idx] = self.coord[valid]
+        atom_masks[res_idx, atom_idx] = 1.0
+
         return atom_positions, atom_masks
-    
+
     def get_chain_breaks(self, max_distance: float = 3.0) -> List[int]:
         """Find chain breaks based on distance between consecutive residues"""
         breaks = []
         prev_c = None
-        res_idx = 0
-        
-        for model in self.structure:
-            for chain in model:
-                for residue in chain:
-                    if residue.get_id()[0] == ' ':  # Standard residue
-                        try:
-                            curr_n = residue['N'].get_coord()
-                            if prev_c is not None:
-                                distance = np.linalg.norm(curr_n - prev_c)
-                                if distance > max_distance:
-                                    breaks.append(res_idx)
-                            prev_c = residue['C'].get_coord()
-                        except KeyError:
-                            # Missing backbone atoms, assume chain break
-                            if prev_c is not None:
-                                breaks.append(res_idx)
-                        res_idx += 1
-        
+
+        for res_idx, (start, stop) in enumerate(self.standard_residue_spans()):
+            names = self.atom_name[start:stop].tolist()
+            if 'N' in names and 'C' in names:
+                curr_n = self.coord[start + names.index('N')]
+                if prev_c is not None:
+                    distance = np.linalg.norm(curr_n - prev_c)
+                    if distance > max_distance:
+                        breaks.append(res_idx)
+                prev_c = self.coord[start + names.index('C')]
+            elif prev_c is not None:
+                # Missing backbone atoms, assume chain break
+                breaks.append(res_idx)
+
         return breaks
 
+def list_pdb_files(pdb_dir: str) -> List[str]:
+    """Paths of the .pdb files in a directory, including symlinked ones"""
+    return [entry.path for entry in os.scandir(pdb_dir)
+            if entry.name.endswith('.pdb') and entry.is_file()]
+
+def _load_or_warn(pdb_file: str) -> Optional[SimpleStructure]:
+    """Load one structure, warning instead of raising on failure"""
+    try:
+        return SimpleStructure(pdb_file)
+    except Exception as e:
+        print(f"Warning: Could not load {pdb_file}: {e}")
+        return None
+
 def load_from_pdb_dir(pdb_dir: str) -> List[SimpleStructure]:
     """Load structures from PDB directory"""
-    structures = []
-    pdb_path = Path(pdb_dir)
-    
-    for pdb_file in pdb_path.glob('*.pdb'):
-        try:
-            structure = SimpleStructure(str(pdb_file))
-            structures.append(structure)
-        except Exception as e:
-            print(f"Warning: Could not load {pdb_file}: {e}")
-            continue
-    
+    return load_from_pdb_list(list_pdb_files(pdb_dir))
+
+def load_from_pdb_dir_parallel(pdb_dir: str, workers: Optional[int] = None) -> List[SimpleStructure]:
+    """
+    Load structures from PDB directory across worker processes
+    Uses all CPUs by default, but never more workers than there are chunks of files;
+    directories that fit in one chunk are loaded serially in this process
+    Parallel loads return structures in completion order; their arrays are read-only like
+    those of SimpleStructure(pdb_file), but they are unpickled copies that are not shared
+    with this process's parse cache
+    """
+    pdb_files = list_pdb_files(pdb_dir)
+    chunksize = 8
+    workers = min(workers or os.cpu_count() or 1, math.ceil(len(pdb_files) / chunksize))
+    if workers <= 1:
+        return load_from_pdb_list(pdb_files)
+
+    with mp.get_context('forkserver').Pool(workers) as pool:
+        structures = [structure for structure in pool.imap_unordered(_load_or_warn, pdb_files, chunksize=chunksize)
+                      if structure is not None]
+
+    for structure in structures:
+        for array in structure.arrays().values():
+            array.setflags(write=False)
     return structures
 
 def load_from_pdb_list(pdb_files: List[str]) -> List[SimpleStructure]:
     """Load structures from list of PDB files"""
-    structures = []
-    
-    for pdb_file in pdb_files:
-        try:
-            structure = SimpleStructure(pdb_file)
-            structures.append(structure)
-        except Exception as e:
-            print(f"Warning: Could not load {pdb_file}: {e}")
-            continue
-    
-    return structures
\ No newline at end of file
+    return [structure for structure in map(_load_or_warn, pdb_files) if structure is not None]
@@ -6,79 +6,101 @@ This demonstrates the new SimpleStructure-based workflow
 
 import sys
 import os
+import argparse
+import logging
+import numpy as np
 from pathlib import Path
 
 # Add AF2 modules to path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'af2_initial_guess'))
 
+log = logging.getLogger(__name__)
+
 def main():
     """Example of using AF2 prediction with PDB files instead of silent files"""
     
-    print("🧬 AF2 Prediction with BioPython Example")
-    print("=" * 50)
+    log.info("🧬 AF2 Prediction with BioPython Example")
+    log.info("=" * 50)
     
     # Test data directory
     pdb_dir = Path(__file__).parent / "inputs" / "pdbs"
     
     if not pdb_dir.exists():
-        print(f"❌ Test data directory not found: {pdb_dir}")
-        print("Please ensure examples/inputs/pdbs/ exists with test PDB files")
-        return 1
-    
-    pdb_files = list(pdb_dir.glob("*.pdb"))
-    if not pdb_files:
-        print(f"❌ No PDB files found in: {pdb_dir}")
+        log.error("❌ Test data directory not found: %s", pdb_dir)
+        log.error("Please ensure examples/inputs/pdbs/ exists with test PDB files")
         return 1
     
-    print(f"📁 Found {len(pdb_files)} PDB files in {pdb_dir}")
-    
     # Test SimpleStructure loading
     try:
-        from simple_structure import SimpleStructure
-        print("✅ SimpleStructure imported successfully")
+        from simple_structure import list_pdb_files, load_from_pdb_dir_parallel
+        
+        pdb_files = list_pdb_files(pdb_dir)
+        if not pdb_files:
+            log.error("❌ No PDB files found in: %s", pdb_dir)
+            return 1
+        
+        log.info("📁 Found %d PDB files in %s", len(pdb_files), pdb_dir)
+        log.info("✅ SimpleStructure imported successfully")
+        
+        # Parse every PDB up front across worker processes, before any GPU work
+        structures = {structure.pdb_file: structure for structure in load_from_pdb_dir_parallel(pdb_dir)}
         
-        # Load a test structure
-        test_pdb = pdb_files[0]
-        print(f"🧪 Testing with: {test_pdb.name}")
+        # Test one of the loaded structures
+        test_pdb = Path(pdb_files[0])
+        log.info("🧪 Testing with: %s", test_pdb.name)
         
-        structure = SimpleStructure(str(test_pdb))
-        print(f"✅ Structure loaded successfully")
-        print(f"   Sequence: {structure.sequence()[:50]}...")
-        print(f"   Residues: {structure.size()}")
-        print(f"   Atoms: {len(structure.atoms)}")
+        if test_pdb not in structures:
+            log.error("❌ Could not load %s", test_pdb)
+            return 1
+        structure = structures[test_pdb]
+        log.info("✅ Structure loaded successfully")
+        log.info("   Sequence: %s...", structure.sequence()[:50])
+        log.info("   Residues: %d", structure.size())
+        log.info("   Atoms: %d", structure.natoms)
         
-        # Test AF2 atom extraction
-        positions, masks = structure.get_atoms_for_af2()
-        print(f"✅ AF2 atoms extracted")
-        print(f"   Positions shape: {positions.shape}")
-        print(f"   Masks shape: {masks.shape}")
+        # Test AF2 atom extraction on every loaded structure, reusing one pair of
+        # scratch buffers sized for the largest structure
+        max_res = max(loaded.size() for loaded in structures.values())
+        positions_buf = np.zeros((max_res, 37, 3), dtype=np.float32)
+        masks_buf = np.zeros((max_res, 37), dtype=np.float32)
+        for loaded in structures.values():
+            positions, masks = loaded.get_atoms_for_af2(out=positions_buf, mask_out=masks_buf)
+            if loaded is structure:
+                log.info("✅ AF2 atoms extracted")
+                log.info("   Positions shape: %s", positions.shape)
+                log.info("   Masks shape: %s", masks.shape)
         
         # Test chain splitting
         chains = structure.split_by_chain()
-        print(f"✅ Chain analysis complete")
-        print(f"   Number of chains: {len(chains)}")
+        log.info("✅ Chain analysis complete")
+        log.info("   Number of chains: %d", len(chains))
         for i, chain in enumerate(chains):
-            print(f"   Chain {i+1}: {chain.size()} residues")
+            log.info("   Chain %d: %d residues", i+1, chain.size())
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("Please install BioPython: pip install biopython")
+        log.error("❌ Import error: %s", e)
+        log.error("Please install BioPython: pip install biopython")
         return 1
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.error("❌ Error: %s", e)
         return 1
     
-    print("\n🚀 Running AF2 prediction with PDB directory...")
-    print("Command that would be used:")
-    print(f"python af2_initial_guess/predict.py -pdbdir {pdb_dir} -outpdbdir outputs_biopython")
+    log.info("\n🚀 Running AF2 prediction with PDB directory...")
+    log.info("Command that would be used:")
+    log.info("python af2_initial_guess/predict.py -pdbdir %s -outpdbdir outputs_biopython", pdb_dir)
     
-    print("\n✅ Example completed successfully!")
-    print("\nNext steps:")
-    print("1. Install BioPython if not already installed: pip install biopython")
-    print("2. Run AF2 prediction with PDB directory instead of silent files")
-    print("3. The pipeline now works without PyRosetta for PDB inputs")
+    log.info("\n✅ Example completed successfully!")
+    log.info("\nNext steps:")
+    log.info("1. Install BioPython if not already installed: pip install biopython")
+    log.info("2. Run AF2 prediction with PDB directory instead of silent files")
+    log.info("3. The pipeline now works without PyRosetta for PDB inputs")
     
     return 0
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-quiet", action="store_true", help='Only report warnings and errors')
+    verbose = not parser.parse_args().quiet
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING,
+                        format='%(message)s', stream=sys.stdout)
     exit(main())
\ No newline at end of file
@@ -6,16 +6,16 @@ This script shows how the enhanced pipeline handles problematic PDB files
 
 import sys
 import os
+import argparse
+import logging
 from pathlib import Path
 import tempfile
 
 # Add modules to path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'af2_initial_guess'))
 
-def create_test_pdb_with_issues(filename: str) -> str:
-    """Create a test PDB with common edge case issues"""
-    
-    pdb_content = """HEADER    COMPLEX                                 01-JAN-21   TEST
+# Two-chain complex where both chains start at residue 1 and chain A carries waters
+_PDB_FIXTURE = b"""HEADER    COMPLEX                                 01-JAN-21   TEST
 TITLE     TEST COMPLEX WITH NUMBERING ISSUES
 REMARK 350 BOTH CHAINS START FROM RESIDUE 1 (PROBLEMATIC)
 ATOM      1  N   ALA A   1      20.154  16.000  10.000  1.00 20.00           N  
@@ -43,150 +43,161 @@ ATOM     22  CB  LEU B   2      12.800  17.300  11.800  1.00 20.00           C
 TER      23      LEU B   2
 END
 """
-    
-    with open(filename, 'w') as f:
-        f.write(pdb_content)
-    
-    return filename
+
+log = logging.getLogger(__name__)
+
+def create_test_pdb_with_issues(fd: int) -> None:
+    """Write a test PDB with common edge case issues to an open file descriptor"""
+    os.write(fd, _PDB_FIXTURE)
 
 def demonstrate_edge_case_handling():
     """Demonstrate how the robust pipeline handles edge cases"""
     
-    print("🧪 Demonstrating Robust AF2 Prediction Edge Case Handling")
-    print("=" * 60)
-    
-    # Create test PDB with issues
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.pdb', delete=False) as tmp:
-        test_pdb = create_test_pdb_with_issues(tmp.name)
+    log.info("🧪 Demonstrating Robust AF2 Prediction Edge Case Handling")
+    log.info("=" * 60)
     
+    test_pdb = None
     try:
+        # Create test PDB with issues
+        fd, test_pdb = tempfile.mkstemp(suffix='.pdb')
+        try:
+            create_test_pdb_with_issues(fd)
+        finally:
+            os.close(fd)
+        
         from robust_structure_handler import prepare_structure_for_af2, RobustStructureHandler
         from simple_structure import SimpleStructure
         
-        print(f"📁 Created test PDB: {test_pdb}")
-        print("   Issues: Both chains start from residue 1, contains water molecules")
+        log.info("📁 Created test PDB: %s", test_pdb)
+        log.info("   Issues: Both chains start from residue 1, contains water molecules")
         
         # Load with basic SimpleStructure (old way)
-        print("\n🔍 Testing Basic SimpleStructure Loading...")
+        log.info("\n🔍 Testing Basic SimpleStructure Loading...")
         try:
             basic_structure = SimpleStructure(test_pdb)
             chains = basic_structure.split_by_chain()
-            print(f"✅ Basic loading successful")
-            print(f"   Chains: {len(chains)}")
-            print(f"   Total residues: {basic_structure.size()}")
+            log.info("✅ Basic loading successful")
+            log.info("   Chains: %d", len(chains))
+            log.info("   Total residues: %d", basic_structure.size())
             
             # Check for residue numbering issues
             handler = RobustStructureHandler()
             validation = handler.validate_structure(basic_structure)
             
             if not validation['valid']:
-                print("❌ Validation issues found:")
+                log.warning("❌ Validation issues found:")
                 for error in validation['errors']:
-                    print(f"   Error: {error}")
+                    log.warning("   Error: %s", error)
             
             if validation['warnings']:
-                print("⚠️  Validation warnings:")
+                log.warning("⚠️  Validation warnings:")
                 for warning in validation['warnings']:
-                    print(f"   Warning: {warning}")
+                    log.warning("   Warning: %s", warning)
                     
         except Exception as e:
-            print(f"❌ Basic loading failed: {e}")
+            log.error("❌ Basic loading failed: %s", e)
         
         # Load with robust handler (new way)
-        print("\n🛡️  Testing Robust Structure Preparation...")
+        log.info("\n🛡️  Testing Robust Structure Preparation...")
         try:
             robust_structure = prepare_structure_for_af2(
-                pdb_file=test_pdb,
+                structure=basic_structure.copy(),
                 auto_clean=True,
                 auto_renumber=True
             )
             
-            print("✅ Robust preparation successful!")
+            log.info("✅ Robust preparation successful!")
             
             # Validate the prepared structure
             validation_after = handler.validate_structure(robust_structure)
             if validation_after['valid']:
-                print("✅ Structure is now valid for AF2 prediction")
+                log.info("✅ Structure is now valid for AF2 prediction")
                 
                 for i, chain_info in enumerate(validation_after['chain_info']):
                     chain_type = "Binder" if i == 0 else "Target"
-                    print(f"   {chain_type} chain: {chain_info['length']} residues "
-                          f"(residues {min(chain_info['residue_numbers'])}-{max(chain_info['residue_numbers'])})")
+                    res_numbers = chain_info['residue_numbers']
+                    log.info("   %s chain: %d residues (residues %d-%d)", chain_type,
+                             chain_info['length'], res_numbers.min(), res_numbers.max())
             else:
-                print("❌ Structure still has issues after preparation")
+                log.error("❌ Structure still has issues after preparation")
                 
         except Exception as e:
-            print(f"❌ Robust preparation failed: {e}")
+            log.error("❌ Robust preparation failed: %s", e)
         
         # Demonstrate different options
-        print("\n🔧 Testing Different Preparation Options...")
+        log.info("\n🔧 Testing Different Preparation Options...")
         
         # Option 1: Conservative (minimal processing)
-        print("\n   Option 1: Conservative Processing")
+        log.info("\n   Option 1: Conservative Processing")
         try:
             conservative = prepare_structure_for_af2(
-                pdb_file=test_pdb,
+                structure=basic_structure.copy(),
                 auto_clean=False,  # Don't remove waters
                 auto_renumber=False  # Don't renumber
             )
-            print("   ✅ Conservative processing works (issues may remain)")
+            log.info("   ✅ Conservative processing works (issues may remain)")
         except Exception as e:
-            print(f"   ❌ Conservative processing failed: {e}")
+            log.error("   ❌ Conservative processing failed: %s", e)
         
         # Option 2: Aggressive cleaning
-        print("\n   Option 2: Aggressive Cleaning")
+        log.info("\n   Option 2: Aggressive Cleaning")
         try:
             aggressive = handler.clean_structure(
-                SimpleStructure(test_pdb),
+                basic_structure.copy(),
                 remove_waters=True,
                 remove_hetero=True,
                 keep_only_ca=False
             )
-            print("   ✅ Aggressive cleaning successful")
-            print(f"   Residues after cleaning: {aggressive.size()}")
+            log.info("   ✅ Aggressive cleaning successful")
+            log.info("   Residues after cleaning: %d", aggressive.size())
         except Exception as e:
-            print(f"   ❌ Aggressive cleaning failed: {e}")
+            log.error("   ❌ Aggressive cleaning failed: %s", e)
         
         # Option 3: Chain specification
-        print("\n   Option 3: Manual Chain Specification")
+        log.info("\n   Option 3: Manual Chain Specification")
         try:
             manual = prepare_structure_for_af2(
-                pdb_file=test_pdb,
+                structure=basic_structure.copy(),
                 binder_chain='A',  # Specify A as binder
                 target_chain='B',  # Specify B as target
                 auto_clean=True,
                 auto_renumber=True
             )
-            print("   ✅ Manual chain specification successful")
+            log.info("   ✅ Manual chain specification successful")
         except Exception as e:
-            print(f"   ❌ Manual chain specification failed: {e}")
+            log.error("   ❌ Manual chain specification failed: %s", e)
         
-        print("\n🎯 Summary:")
-        print("   • Robust handler automatically fixes common PDB issues")
-        print("   • Residue numbering is corrected for AF2 compatibility")
-        print("   • Waters and hetero atoms are removed")
-        print("   • Chain order is handled automatically")
-        print("   • Fallback options available for edge cases")
+        log.info("\n🎯 Summary:")
+        log.info("   • Robust handler automatically fixes common PDB issues")
+        log.info("   • Residue numbering is corrected for AF2 compatibility")
+        log.info("   • Waters and hetero atoms are removed")
+        log.info("   • Chain order is handled automatically")
+        log.info("   • Fallback options available for edge cases")
         
-        print("\n🚀 Command Line Usage:")
-        print("   # Automatic processing (recommended)")
-        print(f"   python af2_initial_guess/predict.py -pdbdir {Path(test_pdb).parent}")
-        print("")
-        print("   # With manual chain specification")
-        print(f"   python af2_initial_guess/predict.py -pdbdir {Path(test_pdb).parent} -binder_chain A -target_chain B")
-        print("")
-        print("   # Conservative processing")
-        print(f"   python af2_initial_guess/predict.py -pdbdir {Path(test_pdb).parent} -auto_clean=False -auto_renumber=False")
+        log.info("\n🚀 Command Line Usage:")
+        log.info("   # Automatic processing (recommended)")
+        log.info("   python af2_initial_guess/predict.py -pdbdir %s", Path(test_pdb).parent)
+        log.info("")
+        log.info("   # With manual chain specification")
+        log.info("   python af2_initial_guess/predict.py -pdbdir %s -binder_chain A -target_chain B", Path(test_pdb).parent)
+        log.info("")
+        log.info("   # Conservative processing")
+        log.info("   python af2_initial_guess/predict.py -pdbdir %s -auto_clean=False -auto_renumber=False", Path(test_pdb).parent)
         
     except ImportError as e:
-        print(f"❌ Import error: {e}")
-        print("Please ensure BioPython is installed: pip install biopython")
+        log.error("❌ Import error: %s", e)
+        log.error("Please ensure BioPython is installed: pip install biopython")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.error("❌ Unexpected error: %s", e)
     finally:
         # Clean up
-        if os.path.exists(test_pdb):
+        if test_pdb is not None and os.path.exists(test_pdb):
             os.unlink(test_pdb)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-quiet", action="store_true", help='Only report warnings and errors')
+    verbose = not parser.parse_args().quiet
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING,
+                        format='%(message)s', stream=sys.stdout)
     demonstrate_edge_case_handling()
\ No newline at end of file
@@ -2,21 +2,10 @@
 
 import os, sys
 
-# PyRosetta imports removed - using SimpleStructure instead
-try:
-    from pyrosetta import *
-    from pyrosetta.rosetta import *
-    init( "-beta_nov16 -in:file:silent_struct_type binary -mute all" +
-        " -use_terminal_residues true -mute basic.io.database core.scoring" )
-    PYROSETTA_AVAILABLE = True
-except ImportError:
-    print("Warning: PyRosetta not available. Silent files will not work without PyRosetta.")
-    PYROSETTA_AVAILABLE = False
-
 # Add AF2 structure handling
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'af2_initial_guess'))
 try:
-    from simple_structure import SimpleStructure, load_from_pdb_dir, load_from_pdb_list
+    from simple_structure import SimpleStructure, list_pdb_files, load_from_pdb_dir, load_from_pdb_list
     from Bio.PDB import PDBParser, PDBIO
     BIOPYTHON_AVAILABLE = True
 except ImportError:
@@ -28,18 +17,32 @@ from collections import OrderedDict
 import time
 import argparse
 import subprocess
-import time
-import glob
 
-import torch
 import json
 
-import util_protein_mpnn as mpnn_util
-
 parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(parent, 'include'))
 from silent_tools import silent_tools
 
+if __name__ == '__main__':
+    # PyRosetta, torch and ProteinMPNN are only needed for design runs,
+    # so build_parser() can be imported without loading them
+
+    # PyRosetta imports removed - using SimpleStructure instead
+    try:
+        from pyrosetta import *
+        from pyrosetta.rosetta import *
+        init( "-beta_nov16 -in:file:silent_struct_type binary -mute all" +
+            " -use_terminal_residues true -mute basic.io.database core.scoring" )
+        PYROSETTA_AVAILABLE = True
+    except ImportError:
+        print("Warning: PyRosetta not available. Silent files will not work without PyRosetta.")
+        PYROSETTA_AVAILABLE = False
+
+    import torch
+
+    import util_protein_mpnn as mpnn_util
+
 def cmd(command, wait=True):
     the_command = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
     if (not wait):
@@ -53,34 +56,39 @@ def range1( iterable ): return range( 1, iterable + 1 )
 # Parse Arguments
 #################################
 
-parser = argparse.ArgumentParser()
 script_dir = os.path.dirname(os.path.realpath(__file__))
 
-# I/O Arguments
-parser.add_argument( "-pdbdir", type=str, default="", help='The name of a directory of pdbs to run through the model' )
-parser.add_argument( "-silent", type=str, default="", help='The name of a silent file to run through the model' )
-parser.add_argument( "-outpdbdir", type=str, default="outputs", help='The directory to which the output PDB files will be written, used if the -pdbdir arg is active' )
-parser.add_argument( "-outsilent", type=str, default="out.silent", help='The name of the silent file to which output structs will be written, used if the -silent arg is active' )
-parser.add_argument( "-runlist", type=str, default='', help="The path of a list of pdb tags to run, only active when the -pdbdir arg is active (default: ''; Run all PDBs)" )
-parser.add_argument( "-checkpoint_name", type=str, default='check.point', help="The name of a file where tags which have finished will be written (default: check.point)" )
-
-parser.add_argument( "-debug", action="store_true", default=False, help='When active, errors will cause the script to crash and the error message to be printed out (default: False)')
-
-# Design Arguments
-parser.add_argument( "-relax_cycles", type=int, default=1, help="The number of relax cycles to perform on each structure (default: 1)" )
-parser.add_argument( "-output_intermediates", action="store_true", help='Whether to write all intermediate sequences from the relax cycles to disk (default: False)' )
-parser.add_argument( "-seqs_per_struct", type=int, default="1", help="The number of sequences to generate for each structure (default: 1)" )
-
-# ProteinMPNN-Specific Arguments
-parser.add_argument( "-checkpoint_path", type=str, default=os.path.join(script_dir, 'ProteinMPNN/vanilla_model_weights/v_48_020.pt'), help=f"The path to the ProteinMPNN weights you wish to use, default {os.path.join(script_dir, 'ProteinMPNN/vanilla_model_weights/v_48_020.pt')}")
-parser.add_argument( "-temperature", type=float, default=0.000001, help='The sampling temperature to use when running ProteinMPNN (default: 0.000001)' )
-parser.add_argument( "-augment_eps", type=float, default=0, help='The variance of random noise to add to the atomic coordinates (default 0)' )
-parser.add_argument( "-protein_features", type=str, default='full', help='What type of protein features to input to ProteinMPNN (default: full)' )
-parser.add_argument( "-omit_AAs", type=str, default='CX', help='A string of all residue types (one letter case-insensitive) that you would not like to use for design. Letters not corresponding to residue types will be ignored (default: CX)' )
-parser.add_argument( "-bias_AA_jsonl", type=str, default='', help='The path to a JSON file containing a dictionary mapping residue one-letter names to the bias for that residue eg. {A: -1.1, F: 0.7} (default: ''; no bias)' )
-parser.add_argument( "-num_connections", type=int, default=48, help='Number of neighbors each residue is connected to. Do not mess around with this argument unless you have a specific set of ProteinMPNN weights which expects a different number of connections. (default: 48)' )
-
-args = parser.parse_args( sys.argv[1:] )
+def build_parser() -> argparse.ArgumentParser:
+    '''
+    Build the command line parser for ProteinMPNN interface design
+    '''
+    parser = argparse.ArgumentParser()
+
+    # I/O Arguments
+    parser.add_argument( "-pdbdir", type=str, default="", help='The name of a directory of pdbs to run through the model' )
+    parser.add_argument( "-silent", type=str, default="", help='The name of a silent file to run through the model' )
+    parser.add_argument( "-outpdbdir", type=str, default="outputs", help='The directory to which the output PDB files will be written, used if the -pdbdir arg is active' )
+    parser.add_argument( "-outsilent", type=str, default="out.silent", help='The name of the silent file to which output structs will be written, used if the -silent arg is active' )
+    parser.add_argument( "-runlist", type=str, default='', help="The path of a list of pdb tags to run, only active when the -pdbdir arg is active (default: ''; Run all PDBs)" )
+    parser.add_argument( "-checkpoint_name", type=str, default='check.point', help="The name of a file where tags which have finished will be written (default: check.point)" )
+
+    parser.add_argument( "-debug", action="store_true", default=False, help='When active, errors will cause the script to crash and the error message to be printed out (default: False)')
+
+    # Design Arguments
+    parser.add_argument( "-relax_cycles", type=int, default=1, help="The number of relax cycles to perform on each structure (default: 1)" )
+    parser.add_argument( "-output_intermediates", action="store_true", help='Whether to write all intermediate sequences from the relax cycles to disk (default: False)' )
+    parser.add_argument( "-seqs_per_struct", type=int, default="1", help="The number of sequences to generate for each structure (default: 1)" )
+
+    # ProteinMPNN-Specific Arguments
+    parser.add_argument( "-checkpoint_path", type=str, default=os.path.join(script_dir, 'ProteinMPNN/vanilla_model_weights/v_48_020.pt'), help=f"The path to the ProteinMPNN weights you wish to use, default {os.path.join(script_dir, 'ProteinMPNN/vanilla_model_weights/v_48_020.pt')}")
+    parser.add_argument( "-temperature", type=float, default=0.000001, help='The sampling temperature to use when running ProteinMPNN (default: 0.000001)' )
+    parser.add_argument( "-augment_eps", type=float, default=0, help='The variance of random noise to add to the atomic coordinates (default 0)' )
+    parser.add_argument( "-protein_features", type=str, default='full', help='What type of protein features to input to ProteinMPNN (default: full)' )
+    parser.add_argument( "-omit_AAs", type=str, default='CX', help='A string of all residue types (one letter case-insensitive) that you would not like to use for design. Letters not corresponding to residue types will be ignored (default: CX)' )
+    parser.add_argument( "-bias_AA_jsonl", type=str, default='', help='The path to a JSON file containing a dictionary mapping residue one-letter names to the bias for that residue eg. {A: -1.1, F: 0.7} (default: ''; no bias)' )
+    parser.add_argument( "-num_connections", type=int, default=48, help='Number of neighbors each residue is connected to. Do not mess around with this argument unless you have a specific set of ProteinMPNN weights which expects a different number of connections. (default: 48)' )
+
+    return parser
 
 class sample_features():
     '''
@@ -346,7 +354,7 @@ class StructManager():
             self.pdbdir    = args.pdbdir
             self.outpdbdir = args.outpdbdir
 
-            self.struct_iterator = glob.glob(os.path.join(args.pdbdir, '*.pdb'))
+            self.struct_iterator = list_pdb_files(args.pdbdir)
 
             # Parse the runlist and determine which structures to process
             if args.runlist != '':
@@ -434,26 +442,29 @@ class StructManager():
 ####### Main #######
 ####################
 
-struct_manager     = StructManager(args)
-proteinmpnn_runner = ProteinMPNN_runner(args, struct_manager)
+if __name__ == '__main__':
+    args = build_parser().parse_args( sys.argv[1:] )
 
-for pdb in struct_manager.iterate():
+    struct_manager     = StructManager(args)
+    proteinmpnn_runner = ProteinMPNN_runner(args, struct_manager)
 
-    if args.debug: proteinmpnn_runner.run_model(pdb, args)
+    for pdb in struct_manager.iterate():
 
-    else: # When not in debug mode the script will continue to run even when some poses fail
-        t0 = time.time()
+        if args.debug: proteinmpnn_runner.run_model(pdb, args)
+
+        else: # When not in debug mode the script will continue to run even when some poses fail
+            t0 = time.time()
 
-        try: proteinmpnn_runner.run_model(pdb, args)
+            try: proteinmpnn_runner.run_model(pdb, args)
 
-        except KeyboardInterrupt: sys.exit( "Script killed by Control+C, exiting" )
+            except KeyboardInterrupt: sys.exit( "Script killed by Control+C, exiting" )
 
-        except:
-            seconds = int(time.time() - t0)
-            print( "Struct with tag %s failed in %i seconds with error: %s"%( pdb, seconds, sys.exc_info()[0] ) )
+            except:
+                seconds = int(time.time() - t0)
+                print( "Struct with tag %s failed in %i seconds with error: %s"%( pdb, seconds, sys.exc_info()[0] ) )
 
-    # We are done with one pdb, record that we finished
-    struct_manager.record_checkpoint(pdb)
+        # We are done with one pdb, record that we finished
+        struct_manager.record_checkpoint(pdb)
     
 
 
@@ -8,6 +8,21 @@ import yaml
 import sys
 from pathlib import Path
 
+# Use the LibYAML (C) loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Required packages for AF2 pipeline
+REQUIRED_CONDA_PACKAGES = frozenset({
+    "python", "numpy", "scipy", "biopython", "pip"
+})
+
+REQUIRED_PIP_PACKAGES = frozenset({
+    "jax", "dm-haiku", "ml-collections", "absl-py"
+})
+
 def validate_environment_file(env_file_path: Path) -> dict:
     """Validate a conda environment file"""
     
@@ -17,20 +32,11 @@ def validate_environment_file(env_file_path: Path) -> dict:
         return {"valid": False, "error": f"File not found: {env_file_path}"}
     
     try:
-        with open(env_file_path) as f:
-            env_data = yaml.safe_load(f)
+        with open(env_file_path, 'rb') as f:
+            env_data = yaml.load(f, Loader=_Loader)
     except yaml.YAMLError as e:
         return {"valid": False, "error": f"YAML parsing error: {e}"}
     
-    # Required packages for AF2 pipeline
-    required_conda_packages = {
-        "python", "numpy", "scipy", "biopython", "pip"
-    }
-    
-    required_pip_packages = {
-        "jax", "dm-haiku", "ml-collections", "absl-py"
-    }
-    
     # Check structure
     if "name" not in env_data:
         return {"valid": False, "error": "Missing environment name"}
@@ -54,26 +60,29 @@ def validate_environment_file(env_file_path: Path) -> dict:
                     pkg_name = pip_dep.split("==")[0].split(">=")[0].split("<=")[0].split("[")[0]
                     pip_packages.add(pkg_name)
     
+    # Package name stems, so "tensorflow-cpu" and "pytorch-cuda" count as their framework
+    conda_stems = {pkg.split("::")[-1].split("-")[0].lower() for pkg in conda_packages}
+    
     # Validate required packages
-    missing_conda = required_conda_packages - conda_packages
-    missing_pip = required_pip_packages - pip_packages
+    missing_conda = REQUIRED_CONDA_PACKAGES - conda_packages
+    missing_pip = REQUIRED_PIP_PACKAGES - pip_packages
     
     warnings = []
     errors = []
     
     if missing_conda:
-        errors.append(f"Missing conda packages: {missing_conda}")
+        errors.append(f"Missing conda packages: {set(missing_conda)}")
     
     if missing_pip:
-        errors.append(f"Missing pip packages: {missing_pip}")
+        errors.append(f"Missing pip packages: {set(missing_pip)}")
     
     # Check for TensorFlow (required by AF2)
-    has_tensorflow = any("tensorflow" in pkg for pkg in conda_packages)
+    has_tensorflow = "tensorflow" in conda_stems
     if not has_tensorflow:
         errors.append("TensorFlow not found (required by AlphaFold2)")
     
     # Check for PyTorch (useful for ProteinMPNN)
-    has_pytorch = any("pytorch" in pkg for pkg in conda_packages)
+    has_pytorch = "pytorch" in conda_stems
     if not has_pytorch:
         warnings.append("PyTorch not found (recommended for ProteinMPNN)")
     
@@ -81,7 +90,10 @@ def validate_environment_file(env_file_path: Path) -> dict:
     jax_packages = [pkg for pkg in pip_packages if "jax" in pkg.lower()]
     if jax_packages:
         # Check if CUDA version is specified appropriately for environment type
-        if "cuda12" in str(env_data).lower() and not any("cuda12" in str(dep) for dep in env_data["dependencies"] if isinstance(dep, dict)):
+        # Any key can mention CUDA 12 (name, channels, variables, ...), so scan the whole file once
+        cuda12_suggested = "cuda12" in str(env_data).lower()
+        has_pip_cuda12 = any("cuda12" in str(dep) for dep in env_data["dependencies"] if isinstance(dep, dict))
+        if cuda12_suggested and not has_pip_cuda12:
             warnings.append("Environment suggests CUDA 12 but JAX CUDA 12 not explicitly specified")
     
     return {